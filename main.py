@@ -0,0 +1,638 @@
+"""Giant's Reach - driving time radius calculator.
+
+Calculates driving time-based radiuses from a location, identifies reachable
+zip codes within a specified time limit, and visualizes the results on a
+color-coded map using the Google Maps APIs.
+"""
+
+import asyncio
+import functools
+import hashlib
+import http.server
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import tkinter as tk
+import webbrowser
+from tkinter import messagebox, ttk
+
+import aiohttp
+import diskcache
+import folium
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import requests
+import shapely
+from shapely.geometry import Point, mapping
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+GOOGLE_API_KEY = os.environ.get("GOOGLE_MAPS_API_KEY", "")
+
+ZIP_CODES_FILE = "zip_codes.geojson"
+ZCTA_PARQUET_FILE = "zcta.parquet"
+STATES_FILE = "states.geojson"
+OUTPUT_MAP_FILE = "driving_time_radius.html"
+RESULTS_GEOJSON_FILE = "results.geojson"
+# Dedicated directory for the served tile map: the localhost server is
+# rooted here, so nothing else (notably the geocode cache) is exposed.
+MAP_OUTPUT_DIR = "map_output"
+TILES_DIR = "tiles"
+CACHE_DIR = ".cache"
+
+# Above this many polygons, embedding raw GeoJSON in the folium HTML makes
+# multi-MB pages that freeze the browser; switch to vector tiles instead.
+TILE_THRESHOLD = 500
+
+# MapLibre GL page for the vector-tile path; %-style placeholders because
+# the JS is full of braces.
+MAPLIBRE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+  <meta charset="utf-8">
+  <title>Giant's Reach</title>
+  <script src="https://unpkg.com/maplibre-gl@3/dist/maplibre-gl.js"></script>
+  <link href="https://unpkg.com/maplibre-gl@3/dist/maplibre-gl.css" rel="stylesheet">
+  <style>html, body, #map { height: 100%%; margin: 0; }</style>
+</head>
+<body>
+<div id="map"></div>
+<script>
+const map = new maplibregl.Map({
+  container: 'map',
+  center: [%(origin_lng)f, %(origin_lat)f],
+  zoom: 8,
+  style: {
+    version: 8,
+    sources: {
+      zips: {
+        type: 'vector',
+        tiles: [window.location.href.replace(/[^/]*$/, '') + '%(tiles_url)s'],
+      },
+    },
+    layers: [
+      {
+        id: 'zips-fill',
+        type: 'fill',
+        source: 'zips',
+        'source-layer': '%(source_layer)s',
+        paint: {
+          'fill-color': ['get', 'fillColor'],
+          'fill-outline-color': '#000000',
+          'fill-opacity': 0.6,
+        },
+      },
+    ],
+  },
+});
+</script>
+</body>
+</html>
+"""
+
+# Routes API batches are I/O bound, so overlap them; 16 in flight stays
+# comfortably under the default QPS ceiling.
+MAX_CONCURRENT_REQUESTS = 16
+MAX_RETRIES = 5
+
+# Crude upper bound on average highway speed, used to turn a driving-time
+# budget into a great-circle distance cap for pre-filtering.
+MAX_SPEED_MPH = 80
+MILES_TO_KM = 1.60934
+EARTH_RADIUS_KM = 6371.0
+
+
+class DrivingTimeCalculator:
+    """Core calculation engine: geocoding, driving times, filtering, mapping."""
+
+    def __init__(self, api_key):
+        self.api_key = api_key
+        self.zip_gdf = None
+        self.zip_gdf_5070 = None
+        self.states_gdf = None
+        self._loaded_bbox = None
+        self.centroid_lat = None
+        self.centroid_lon = None
+        self.zcta = None
+        self.state = None
+        self.geoms = None
+        self.geoms_simple = None
+        self._tile_server = None
+        # Disk cache persists geocodes and rendered maps across runs.
+        self._cache = diskcache.Cache(CACHE_DIR)
+        # Persistent session so repeated Google API calls reuse pooled
+        # connections instead of paying a TCP+TLS handshake each time.
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+            ),
+        ))
+
+    def load_data(self, bbox=None):
+        """Load the ZCTA (zip code tabulation area) boundaries.
+
+        The pyogrio engine pushes the column selection and optional
+        (minx, miny, maxx, maxy) bbox down into the reader, so only the
+        needed attributes - and only the area of interest - are parsed.
+        When the GeoParquet conversion exists (see convert_to_parquet.py)
+        it is preferred: columnar, zstd-compressed, and carrying centroid
+        lat/lon as plain columns.
+        """
+        if os.path.exists(ZCTA_PARQUET_FILE):
+            self.zip_gdf = gpd.read_parquet(ZCTA_PARQUET_FILE)
+            if bbox is not None:
+                self.zip_gdf = self.zip_gdf.cx[bbox[0]:bbox[2], bbox[1]:bbox[3]]
+        else:
+            self.zip_gdf = gpd.read_file(
+                ZIP_CODES_FILE, engine="pyogrio", columns=["ZCTA5"], bbox=bbox
+            )
+        self._loaded_bbox = bbox
+        # Attach each zip's state in one spatial join (STRtree-backed in
+        # Shapely 2.x) rather than looking states up per result row.
+        self.states_gdf = gpd.read_file(
+            STATES_FILE, engine="pyogrio", columns=["STUSPS"], bbox=bbox
+        )
+        self.zip_gdf = gpd.sjoin(
+            self.zip_gdf,
+            self.states_gdf[["STUSPS", "geometry"]],
+            how="left",
+            predicate="within",
+        ).drop(columns="index_right")
+        # Cache centroids, zip codes, and states as flat arrays once, so
+        # recalculations never re-run per-geometry calls or row iteration.
+        # The parquet conversion ships centroids as plain columns; otherwise
+        # shapely.centroid computes them for the whole geometry array in one
+        # GIL-releasing GEOS call instead of one call per polygon.
+        if "cent_lat" in self.zip_gdf.columns:
+            self.centroid_lat = self.zip_gdf["cent_lat"].to_numpy()
+            self.centroid_lon = self.zip_gdf["cent_lon"].to_numpy()
+        else:
+            cents = shapely.centroid(self.zip_gdf.geometry.values)
+            self.centroid_lat = shapely.get_y(cents)
+            self.centroid_lon = shapely.get_x(cents)
+        self.zcta = self.zip_gdf["ZCTA5"].to_numpy()
+        self.state = self.zip_gdf["STUSPS"].to_numpy()
+        # Equal-area projection for metric buffering and spatial-index
+        # candidate queries (EPSG:5070 covers CONUS).
+        self.zip_gdf_5070 = self.zip_gdf.to_crs(epsg=5070)
+        # Pre-simplify boundaries for rendering only (~100m tolerance);
+        # centroids and the state join keep the full-resolution geometry.
+        self.zip_gdf["geometry_simple"] = shapely.simplify(
+            self.zip_gdf.geometry.values, tolerance=0.001, preserve_topology=True
+        )
+        # Geometry arrays for the batch loop: plain NumPy indexing, no
+        # pandas dispatch per result element.
+        self.geoms = self.zip_gdf.geometry.values
+        self.geoms_simple = self.zip_gdf["geometry_simple"].values
+
+    @functools.lru_cache(maxsize=1024)
+    def geocode_address(self, address):
+        """Geocode an address to (lat, lng, state abbreviation).
+
+        Results are memoized in-process and persisted on disk, so repeated
+        runs with the same address never hit the API again.
+        """
+        cache_key = ("geocode", address)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        url = "https://maps.googleapis.com/maps/api/geocode/json"
+        response = self._session.get(url, params={"address": address, "key": self.api_key})
+        data = response.json()
+        if data["status"] != "OK":
+            raise ValueError(f"Could not geocode address: {data['status']}")
+        result = data["results"][0]
+        location = result["geometry"]["location"]
+        state = None
+        for component in result["address_components"]:
+            if "administrative_area_level_1" in component["types"]:
+                state = component["short_name"]
+                break
+        geocoded = (location["lat"], location["lng"], state)
+        self._cache.set(cache_key, geocoded)
+        return geocoded
+
+    def _bbox_around(self, lat, lng, distance_km):
+        """(minx, miny, maxx, maxy) box with a distance_km margin around a point."""
+        dlat = distance_km / 111.0
+        dlng = distance_km / (111.0 * max(np.cos(np.radians(lat)), 0.01))
+        return (lng - dlng, lat - dlat, lng + dlng, lat + dlat)
+
+    def _bbox_covers(self, bbox):
+        """Whether the currently loaded data covers the requested bbox."""
+        if self.zip_gdf is None:
+            return False
+        if self._loaded_bbox is None:  # full dataset loaded
+            return True
+        return (
+            self._loaded_bbox[0] <= bbox[0]
+            and self._loaded_bbox[1] <= bbox[1]
+            and self._loaded_bbox[2] >= bbox[2]
+            and self._loaded_bbox[3] >= bbox[3]
+        )
+
+    def haversine_distances_km(self, origin_lat, origin_lng):
+        """Vectorized great-circle distance from the origin to every zip centroid."""
+        lat2 = np.radians(self.centroid_lat)
+        lon2 = np.radians(self.centroid_lon)
+        lat1 = np.radians(origin_lat)
+        lon1 = np.radians(origin_lng)
+        dlat = lat2 - lat1
+        dlon = lon2 - lon1
+        a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+        return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+    def _build_matrix_payload(self, origin_coords, batch_idx):
+        """Build a computeRouteMatrix payload for one batch of zip indices."""
+        origin_lat, origin_lng = origin_coords
+        destinations = []
+        for lat, lng in zip(self.centroid_lat[batch_idx], self.centroid_lon[batch_idx]):
+            destinations.append({
+                "waypoint": {
+                    "location": {
+                        "latLng": {
+                            "latitude": lat,
+                            "longitude": lng,
+                        }
+                    }
+                }
+            })
+        return {
+            "origins": [{
+                "waypoint": {
+                    "location": {
+                        "latLng": {
+                            "latitude": origin_lat,
+                            "longitude": origin_lng,
+                        }
+                    }
+                }
+            }],
+            "destinations": destinations,
+            "travelMode": "DRIVE",
+        }
+
+    async def _post_batch(self, session, semaphore, url, headers, payload):
+        """POST one matrix batch, retrying 429/5xx with exponential backoff."""
+        backoff = 1.0
+        for attempt in range(MAX_RETRIES):
+            async with semaphore:
+                async with session.post(url, headers=headers, json=payload) as response:
+                    if response.status == 429 or response.status >= 500:
+                        # Retry-After may also be an HTTP-date; fall back to
+                        # our own backoff when it isn't delta-seconds.
+                        try:
+                            delay = float(response.headers["Retry-After"])
+                        except (KeyError, ValueError):
+                            delay = backoff
+                        backoff *= 2
+                    else:
+                        response.raise_for_status()
+                        return await response.json()
+            if attempt < MAX_RETRIES - 1:
+                await asyncio.sleep(delay)
+        raise RuntimeError(f"Routes API batch failed after {MAX_RETRIES} retries")
+
+    async def calculate_driving_times(self, origin_coords, candidate_idx, max_driving_time):
+        """Query the Google Routes API for driving times to each zip centroid.
+
+        `candidate_idx` is an integer index array into the cached centroid
+        arrays (and `self.zip_gdf`). Batches are POSTed concurrently since
+        the work is purely I/O bound.
+        """
+        url = "https://routes.googleapis.com/distanceMatrix/v2:computeRouteMatrix"
+        headers = {
+            "Content-Type": "application/json",
+            "X-Goog-Api-Key": self.api_key,
+            "X-Goog-FieldMask": "originIndex,destinationIndex,duration,condition",
+        }
+
+        results = []
+        batch_size = 25  # Routes API matrix limit per request
+        batches = [
+            candidate_idx[i:i + batch_size]
+            for i in range(0, len(candidate_idx), batch_size)
+        ]
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        connector = aiohttp.TCPConnector(limit_per_host=64)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            # Candidates arrive sorted nearest-first, so probe them in
+            # concentric rings of batches: once an entire ring comes back
+            # beyond the time budget, everything farther out is too.
+            ring_size = MAX_CONCURRENT_REQUESTS
+            for start in range(0, len(batches), ring_size):
+                ring = batches[start:start + ring_size]
+                responses = await asyncio.gather(*[
+                    self._post_batch(
+                        session, semaphore, url, headers,
+                        self._build_matrix_payload(origin_coords, batch_idx),
+                    )
+                    for batch_idx in ring
+                ])
+
+                ring_min_minutes = float("inf")
+                for batch_idx, data in zip(ring, responses):
+                    # computeRouteMatrix returns a flat JSON array of
+                    # elements, one per origin/destination pair, with
+                    # durations like "1234s".
+                    for element in data:
+                        if element.get("condition") != "ROUTE_EXISTS":
+                            continue
+                        zip_idx = batch_idx[element["destinationIndex"]]
+                        minutes = float(element["duration"].rstrip("s")) / 60
+                        ring_min_minutes = min(ring_min_minutes, minutes)
+                        results.append({
+                            "zip_code": self.zcta[zip_idx],
+                            "state": self.state[zip_idx],
+                            "driving_time_minutes": minutes,
+                            "geometry": self.geoms[zip_idx],
+                            "geometry_simple": self.geoms_simple[zip_idx],
+                        })
+
+                # A ring with no routable element (e.g. all water zips) says
+                # nothing about distance; only stop once a ring's routable
+                # results were all beyond the budget.
+                ring_had_routes = ring_min_minutes != float("inf")
+                if ring_had_routes and ring_min_minutes > max_driving_time:
+                    break
+
+        # Explicit columns so an empty result set still filters cleanly.
+        return pd.DataFrame(results, columns=[
+            "zip_code",
+            "state",
+            "driving_time_minutes",
+            "geometry",
+            "geometry_simple",
+        ])
+
+    def filter_results(self, driving_results, max_time, origin_state, respect_state_lines):
+        """Keep zips within the time budget, optionally within the origin state."""
+        mask = driving_results["driving_time_minutes"].to_numpy() <= max_time
+        if respect_state_lines:
+            mask &= driving_results["state"].to_numpy() == origin_state
+        return driving_results.loc[mask]
+
+    def get_colors_for_times(self, driving_times, max_time):
+        """Green (close) to red (far) hex colors for an array of driving times."""
+        ratio = np.minimum(np.asarray(driving_times, dtype=np.float64) / max_time, 1.0)
+        red = (255 * ratio).astype(np.uint8)
+        green = (255 * (1 - ratio)).astype(np.uint8)
+        return np.array([f"#{r:02x}{g:02x}00" for r, g in zip(red, green)])
+
+    def _build_feature_collection(self, filtered_results, max_time):
+        """Serialize the filtered zips to a styled GeoJSON FeatureCollection."""
+        colors = self.get_colors_for_times(
+            filtered_results["driving_time_minutes"].to_numpy(), max_time
+        )
+        # itertuples yields plain tuples instead of boxing a Series per row.
+        rows = filtered_results[
+            ["geometry_simple", "zip_code", "driving_time_minutes"]
+        ].itertuples(index=False, name=None)
+        features = []
+        for color, (geom, zip_code, minutes) in zip(colors, rows):
+            features.append({
+                "type": "Feature",
+                "geometry": mapping(geom),
+                "properties": {
+                    "fillColor": color,
+                    "zip": zip_code,
+                    "time": round(minutes, 1),
+                },
+            })
+        return {"type": "FeatureCollection", "features": features}
+
+    def create_map(self, origin_coords, filtered_results, max_time, respect_state_lines=True):
+        """Render the filtered zips to a color-coded map.
+
+        Small result sets are embedded directly in a folium HTML page. Large
+        ones are pre-cut into MVT vector tiles (when tippecanoe is available)
+        and rendered with MapLibre GL, so the browser only ever loads the
+        tiles in its viewport. Identical calculations reuse the previously
+        rendered HTML from the disk cache.
+
+        Returns the path of an HTML file (or, for the tile path, a
+        localhost URL) ready to open in a browser.
+        """
+        map_key = ("map", hashlib.sha256(repr(
+            (origin_coords, max_time, respect_state_lines, len(filtered_results))
+        ).encode()).hexdigest())
+        cached_html = self._cache.get(map_key)
+        if cached_html is not None:
+            return self._write_temp_map(cached_html)
+
+        feature_collection = self._build_feature_collection(filtered_results, max_time)
+
+        if len(filtered_results) > TILE_THRESHOLD and shutil.which("tippecanoe"):
+            return self._create_tile_map(origin_coords, feature_collection)
+
+        m = folium.Map(location=list(origin_coords), zoom_start=9)
+        folium.Marker(
+            location=list(origin_coords),
+            popup="Origin",
+            icon=folium.Icon(color="blue", icon="home"),
+        ).add_to(m)
+
+        # One FeatureCollection layer with per-feature colors: folium
+        # serializes (and Leaflet renders) a single GeoJson object instead
+        # of one layer per polygon. Skipped entirely when nothing survived
+        # filtering - GeoJsonTooltip asserts its fields exist in the data,
+        # which an empty collection cannot satisfy, and an origin-only map
+        # is the right answer for an empty result set anyway.
+        if feature_collection["features"]:
+            folium.GeoJson(
+                feature_collection,
+                style_function=lambda feature: {
+                    "fillColor": feature["properties"]["fillColor"],
+                    "color": "black",
+                    "weight": 1,
+                    "fillOpacity": 0.6,
+                },
+                tooltip=folium.GeoJsonTooltip(
+                    fields=["zip", "time"], aliases=["Zip", "Minutes"]
+                ),
+            ).add_to(m)
+
+        # Render in memory rather than bouncing through a fixed output file.
+        html = m.get_root().render()
+        self._cache.set(map_key, html)
+        return self._write_temp_map(html)
+
+    def _write_temp_map(self, html):
+        """Write rendered map HTML to a tempfile and return its path."""
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".html", prefix="driving_time_", delete=False
+        ) as f:
+            f.write(html)
+            return f.name
+
+    def _serve_output_dir(self):
+        """Start (once) a localhost HTTP server rooted at MAP_OUTPUT_DIR.
+
+        MapLibre fetches tiles via XHR, which browsers block on file://
+        origins, so the tile map has to be opened over HTTP. Only the map
+        page and its tiles live under the serving root.
+        """
+        if self._tile_server is None:
+            handler = functools.partial(
+                http.server.SimpleHTTPRequestHandler,
+                directory=os.path.abspath(MAP_OUTPUT_DIR),
+            )
+            self._tile_server = http.server.ThreadingHTTPServer(
+                ("127.0.0.1", 0), handler
+            )
+            threading.Thread(
+                target=self._tile_server.serve_forever, daemon=True
+            ).start()
+        return self._tile_server.server_address[1]
+
+    def _create_tile_map(self, origin_coords, feature_collection):
+        """Cut the results into vector tiles and write a MapLibre GL page.
+
+        The page and tiles are served from a background localhost server;
+        the returned URL is ready to open in a browser.
+        """
+        with open(RESULTS_GEOJSON_FILE, "w") as f:
+            json.dump(feature_collection, f)
+
+        os.makedirs(MAP_OUTPUT_DIR, exist_ok=True)
+        subprocess.run([
+            "tippecanoe",
+            "-zg",
+            "--force",
+            "--no-tile-compression",
+            "--drop-densest-as-needed",
+            "--output-to-directory", os.path.join(MAP_OUTPUT_DIR, TILES_DIR),
+            RESULTS_GEOJSON_FILE,
+        ], check=True)
+
+        origin_lat, origin_lng = origin_coords
+        html = MAPLIBRE_TEMPLATE % {
+            "tiles_url": TILES_DIR + "/{z}/{x}/{y}.pbf",
+            "source_layer": os.path.splitext(RESULTS_GEOJSON_FILE)[0],
+            "origin_lat": origin_lat,
+            "origin_lng": origin_lng,
+        }
+        # The page must live next to the tile directory so its relative
+        # tile URLs resolve against the serving root.
+        with open(os.path.join(MAP_OUTPUT_DIR, OUTPUT_MAP_FILE), "w") as f:
+            f.write(html)
+        port = self._serve_output_dir()
+        return f"http://127.0.0.1:{port}/{OUTPUT_MAP_FILE}"
+
+    def run_calculation(self, address, max_time, respect_state_lines=True):
+        """Full pipeline: geocode, query driving times, filter, and map."""
+        origin_lat, origin_lng, origin_state = self.geocode_address(address)
+
+        # Only load (and parse) the area that could possibly be reachable;
+        # reuse the loaded data when it already covers the request.
+        max_distance_km = max_time / 60 * MAX_SPEED_MPH * MILES_TO_KM
+        bbox = self._bbox_around(origin_lat, origin_lng, max_distance_km)
+        if not self._bbox_covers(bbox):
+            self.load_data(bbox=bbox)
+
+        # Select candidates by buffering the origin to the crude upper-bound
+        # radius in a projected CRS and querying the STRtree spatial index:
+        # nothing farther than max_time at highway speed can qualify, and the
+        # index answers in O(log N) instead of scanning every centroid.
+        origin_5070 = (
+            gpd.GeoSeries([Point(origin_lng, origin_lat)], crs=4326)
+            .to_crs(epsg=5070)
+            .iloc[0]
+        )
+        reach_buffer = origin_5070.buffer(max_distance_km * 1000)
+        reachable_idx = np.sort(
+            self.zip_gdf_5070.sindex.query(reach_buffer, predicate="intersects")
+        )
+
+        # Probe nearest-first so the concentric-ring expansion in
+        # calculate_driving_times can stop once a whole ring is out of range.
+        distances_km = self.haversine_distances_km(origin_lat, origin_lng)
+        candidate_idx = reachable_idx[np.argsort(distances_km[reachable_idx])]
+
+        driving_results = asyncio.run(self.calculate_driving_times(
+            (origin_lat, origin_lng), candidate_idx, max_time
+        ))
+        filtered = self.filter_results(
+            driving_results, max_time, origin_state, respect_state_lines
+        )
+        return self.create_map(
+            (origin_lat, origin_lng), filtered, max_time, respect_state_lines
+        )
+
+
+class App:
+    """Tkinter front-end for the calculator."""
+
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Giant's Reach")
+        self.calculator = DrivingTimeCalculator(GOOGLE_API_KEY)
+
+        frame = ttk.Frame(root, padding=10)
+        frame.grid(row=0, column=0, sticky="nsew")
+
+        ttk.Label(frame, text="Address:").grid(row=0, column=0, sticky="w")
+        self.address_entry = ttk.Entry(frame, width=40)
+        self.address_entry.grid(row=0, column=1, pady=2)
+
+        ttk.Label(frame, text="Max driving time (min):").grid(row=1, column=0, sticky="w")
+        self.time_entry = ttk.Entry(frame, width=10)
+        self.time_entry.insert(0, "60")
+        self.time_entry.grid(row=1, column=1, sticky="w", pady=2)
+
+        self.respect_state_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            frame, text="Respect state lines", variable=self.respect_state_var
+        ).grid(row=2, column=0, columnspan=2, sticky="w")
+
+        self.calculate_button = ttk.Button(frame, text="Calculate", command=self.start_calculation)
+        self.calculate_button.grid(row=3, column=0, columnspan=2, pady=5)
+
+        self.status_label = ttk.Label(frame, text="")
+        self.status_label.grid(row=4, column=0, columnspan=2)
+
+    def start_calculation(self):
+        self.calculate_button.config(state="disabled")
+        self.status_label.config(text="Calculating...")
+        thread = threading.Thread(target=self.calculate_thread, daemon=True)
+        thread.start()
+
+    def calculate_thread(self):
+        try:
+            address = self.address_entry.get()
+            max_time = float(self.time_entry.get())
+            map_path = self.calculator.run_calculation(
+                address, max_time, self.respect_state_var.get()
+            )
+            if map_path.startswith("http"):
+                webbrowser.open(map_path)
+            else:
+                webbrowser.open("file://" + map_path)
+            self.root.after(0, lambda: self.status_label.config(text="Done."))
+        except Exception as exc:  # surface worker errors in the GUI
+            message = str(exc)
+            self.root.after(0, lambda: messagebox.showerror("Error", message))
+            self.root.after(0, lambda: self.status_label.config(text="Failed."))
+        finally:
+            self.root.after(0, lambda: self.calculate_button.config(state="normal"))
+
+
+def main():
+    root = tk.Tk()
+    App(root)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()